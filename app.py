@@ -1,75 +1,280 @@
-from flask import Flask, render_template, request, redirect, url_for
+from flask import Flask, render_template, request, redirect, url_for, abort, jsonify
+from flask.helpers import get_debug_flag
 from flask_sqlalchemy import SQLAlchemy
+from flask_sqlalchemy.record_queries import get_recorded_queries
+from flask_caching import Cache
+from jinja2 import FileSystemBytecodeCache
+from sqlalchemy import event, func, select, insert, update, delete as sql_delete
+from sqlalchemy.engine import Engine
+import click
+import math
 import os
+import threading
 
 app = Flask(__name__)
+# `python app.py` runs the debug server; other entry points follow FLASK_DEBUG.
+# Decided before SQLAlchemy(app) so query recording matches app.run().
+DEBUG = __name__ == "__main__" or get_debug_flag()
 
 # ---- Database configuration ----
 BASE_DIR = os.path.abspath(os.path.dirname(__file__))
-DB_PATH = os.path.join(BASE_DIR, "tasks.db")
+# DB_PATH can point at a tmpfs file (e.g. /dev/shm/tasks.db) or be ":memory:"
+# to keep dev and CI runs off the disk entirely. Flask-SQLAlchemy serves an
+# in-memory database from a single shared connection, so all requests see it.
+# Relative paths are taken from the current directory, not Flask's instance/.
+DB_PATH = os.environ.get("DB_PATH") or os.path.join(BASE_DIR, "tasks.db")
+if DB_PATH != ":memory:":
+    DB_PATH = os.path.abspath(DB_PATH)
 
 app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite:///" + DB_PATH
 app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
+# Wait up to 30s on a locked database instead of failing with "database is
+# locked"; the pool itself stays at SQLAlchemy's defaults.
+app.config["SQLALCHEMY_ENGINE_OPTIONS"] = {"connect_args": {"timeout": 30}}
+# Record queries in debug so per-request N+1 patterns show up in the log
+app.config["SQLALCHEMY_RECORD_QUERIES"] = DEBUG
 app.config["SECRET_KEY"] = "dev"  # prevents some Flask warnings
 
+# ---- Templates ----
+# Reuse compiled template bytecode across processes and compile index.html
+# once at import instead of on the first request. Like Python's own
+# __pycache__, the cache is skipped when the app directory is read-only.
+JINJA_CACHE_DIR = os.path.join(BASE_DIR, "__pycache__", "jinja")
+try:
+    os.makedirs(JINJA_CACHE_DIR, exist_ok=True)
+except OSError:
+    pass
+else:
+    if os.access(JINJA_CACHE_DIR, os.W_OK):
+        app.jinja_env.bytecode_cache = FileSystemBytecodeCache(JINJA_CACHE_DIR)
+app.jinja_env.get_template("index.html")
+
 db = SQLAlchemy(app)
+cache = Cache(app, config={"CACHE_TYPE": "SimpleCache"})
+
+# ---- SQLite tuning ----
+# WAL lets the index page read while a write is committing, and
+# synchronous=NORMAL drops the extra fsync per commit.
+OPTIMIZE_EVERY = 500  # requests between PRAGMA optimize runs
+_request_count = 0
+_request_count_lock = threading.Lock()
+
+@event.listens_for(Engine, "connect")
+def set_sqlite_pragmas(dbapi_connection, connection_record):
+    if ":memory:" in app.config["SQLALCHEMY_DATABASE_URI"]:
+        return
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA mmap_size=134217728")
+    cursor.execute("PRAGMA cache_size=-20000")
+    cursor.close()
+
+# Runs once the handler is done, on the request's own session connection
+@app.teardown_request
+def periodic_optimize(exc):
+    global _request_count
+    if exc is not None or request.endpoint == "static":
+        return
+    with _request_count_lock:
+        _request_count += 1
+        due = _request_count % OPTIMIZE_EVERY == 0
+    if due:
+        db.session.connection().exec_driver_sql("PRAGMA optimize")
 
 # ---- Task Model ----
+CONTENT_MAX_LENGTH = 200
+
 class Task(db.Model):
     id = db.Column(db.Integer, primary_key=True)
-    content = db.Column(db.String(200), nullable=False)
+    content = db.Column(db.String(CONTENT_MAX_LENGTH), nullable=False)
     completed = db.Column(db.Boolean, default=False)
 
     def __repr__(self):
         return f"<Task {self.id}>"
 
+# Matches the index page order, so each page is a range scan with no sort step
+db.Index("ix_task_completed_id", Task.completed, Task.id.desc())
+
 # ---- Create database ----
-with app.app_context():
+# Run once per deploy with `flask --app app init-db` rather than on every import
+def create_tables():
     db.create_all()
+    # create_all() skips existing tables, so add any new indexes explicitly
+    for index in Task.__table__.indexes:
+        index.create(db.engine, checkfirst=True)
+
+@app.cli.command("init-db")
+def init_db():
+    """Create the database tables and indexes."""
+    create_tables()
+    click.echo("Initialized the database.")
+
+# An in-memory database starts empty in every process
+if DB_PATH == ":memory:":
+    with app.app_context():
+        create_tables()
+
+# ---- Query guard ----
+MAX_QUERIES_PER_REQUEST = 5
+
+@app.after_request
+def warn_on_query_burst(response):
+    if app.config["SQLALCHEMY_RECORD_QUERIES"]:
+        queries = get_recorded_queries()
+        if len(queries) > MAX_QUERIES_PER_REQUEST:
+            app.logger.warning(
+                "%s issued %d queries (limit %d), check for lazy loads",
+                request.path, len(queries), MAX_QUERIES_PER_REQUEST,
+            )
+    return response
+
+# ---- Cache helpers ----
+# The rendered index page is cached per page number and per tasks version;
+# every write bumps the version so stale pages are simply never looked up
+# again. The version lives outside the cache so evictions can't reset it.
+_tasks_version = 0
+_tasks_version_lock = threading.Lock()
+
+def requested_page():
+    return max(request.args.get("page", 1, type=int), 1)
+
+def index_cache_key():
+    return f"index:{_tasks_version}:{requested_page()}"
+
+def is_rendered_page(rv):
+    # Redirects for out-of-range pages are not cached, so junk page numbers
+    # can't fill the cache with copies of the last page
+    return isinstance(rv, str)
+
+def bump_tasks_version():
+    global _tasks_version
+    with _tasks_version_lock:
+        _tasks_version += 1
+
+# ---- Write helpers ----
+def clean_content(raw):
+    content = (raw or "").strip()
+    if len(content) > CONTENT_MAX_LENGTH:
+        abort(400)
+    return content
+
+def insert_tasks(rows):
+    # One executemany INSERT in one transaction, however many rows there are
+    db.session.execute(insert(Task), rows)
+    db.session.commit()
+    bump_tasks_version()
 
 # ---- Routes ----
+TASKS_PER_PAGE = 50
+
 @app.route("/")
+@cache.cached(
+    timeout=30, key_prefix=index_cache_key, response_filter=is_rendered_page
+)
 def index():
-    tasks = Task.query.order_by(Task.id.desc()).all()
-    return render_template("index.html", tasks=tasks)
+    total, completed_total = db.session.execute(
+        select(func.count(Task.id), func.count(Task.id).filter(Task.completed))
+    ).one()
+    pages = max(math.ceil(total / TASKS_PER_PAGE), 1)
+    page = requested_page()
+    if page > pages:
+        return redirect(url_for("index", page=pages))
+
+    # Pending tasks first so they fill the early pages. Plain rows are enough
+    # for the template and skip ORM object hydration.
+    tasks = db.session.execute(
+        select(Task.id, Task.content, Task.completed)
+        .order_by(Task.completed, Task.id.desc())
+        .limit(TASKS_PER_PAGE)
+        .offset((page - 1) * TASKS_PER_PAGE)
+    ).all()
+    return render_template(
+        "index.html",
+        tasks=tasks,
+        total=total,
+        completed_total=completed_total,
+        page=page,
+        pages=pages,
+    )
 
 @app.route("/add", methods=["POST"])
 def add():
-    task_content = request.form.get("content")
+    task_content = clean_content(request.form.get("content"))
 
-    if task_content and task_content.strip():
-        new_task = Task(content=task_content.strip())
-        db.session.add(new_task)
-        db.session.commit()
+    if task_content:
+        insert_tasks([{"content": task_content}])
 
     return redirect(url_for("index"))
 
 @app.route("/complete/<int:id>")
 def complete(id):
-    task = Task.query.get_or_404(id)
-    task.completed = not task.completed
+    result = db.session.execute(
+        update(Task)
+        .where(Task.id == id)
+        .values(completed=~Task.completed)
+        .returning(Task.completed)
+    )
+    if result.first() is None:
+        abort(404)
     db.session.commit()
+    bump_tasks_version()
     return redirect(url_for("index"))
 
 @app.route("/delete/<int:id>")
 def delete(id):
-    task = Task.query.get_or_404(id)
-    db.session.delete(task)
+    result = db.session.execute(sql_delete(Task).where(Task.id == id))
+    if result.rowcount == 0:
+        abort(404)
     db.session.commit()
+    bump_tasks_version()
     return redirect(url_for("index"))
 
 # ---- Run app ----
 @app.route("/edit/<int:id>", methods=["POST"])
 def edit(id):
-    task = Task.query.get_or_404(id)
-    new_content = request.form.get("content")
+    new_content = (request.form.get("content") or "").strip()
 
-    if new_content and new_content.strip():
-        task.content = new_content.strip()
+    if new_content and len(new_content) <= CONTENT_MAX_LENGTH:
+        result = db.session.execute(
+            update(Task).where(Task.id == id).values(content=new_content)
+        )
+        if result.rowcount == 0:
+            abort(404)
         db.session.commit()
+        bump_tasks_version()
+    else:
+        # No UPDATE ran to detect a missing task, so check for it directly
+        if db.session.get(Task, id) is None:
+            abort(404)
+        if new_content:
+            abort(400)
 
     return redirect(url_for("index"))
 
+@app.route("/api/tasks/bulk", methods=["POST"])
+def bulk_add():
+    data = request.get_json(silent=True)
+    if not isinstance(data, list):
+        abort(400)
+
+    rows = []
+    for item in data:
+        if not isinstance(item, dict) or not isinstance(item.get("content"), str):
+            abort(400)
+        content = clean_content(item["content"])
+        if content:
+            rows.append({"content": content})
+
+    if not rows:
+        return jsonify({"inserted": 0}), 200
+
+    insert_tasks(rows)
+    return jsonify({"inserted": len(rows)}), 201
+
 
 if __name__ == "__main__":
-    app.run(debug=True)
\ No newline at end of file
+    with app.app_context():
+        create_tables()
+    app.run(debug=DEBUG)
\ No newline at end of file
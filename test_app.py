@@ -0,0 +1,158 @@
+import os
+
+# Must be set before app.py is imported: it picks the database at import time
+os.environ["DB_PATH"] = ":memory:"
+
+import pytest
+from sqlalchemy import delete, event
+
+from app import app, cache, db, Task
+
+
+@pytest.fixture
+def client():
+    with app.app_context():
+        db.session.execute(delete(Task))
+        db.session.commit()
+    cache.clear()
+    with app.test_client() as client:
+        yield client
+
+
+@pytest.fixture
+def queries():
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    with app.app_context():
+        engine = db.engine
+    event.listen(engine, "before_cursor_execute", record)
+    yield statements
+    event.remove(engine, "before_cursor_execute", record)
+
+
+def test_index_query_count(client, queries):
+    client.post("/api/tasks/bulk", json=[{"content": f"task {i}"} for i in range(20)])
+    queries.clear()
+
+    response = client.get("/")
+
+    assert response.status_code == 200
+    assert len(queries) <= 2
+
+
+def test_add_and_complete(client):
+    client.post("/add", data={"content": "  write tests  "})
+    response = client.get("/")
+    assert b"write tests" in response.data
+
+    with app.app_context():
+        task_id = db.session.execute(db.select(Task.id)).scalar_one()
+    assert client.get(f"/complete/{task_id}").status_code == 302
+    with app.app_context():
+        assert db.session.get(Task, task_id).completed
+
+
+def test_missing_task_is_404(client):
+    assert client.get("/complete/999").status_code == 404
+    assert client.get("/delete/999").status_code == 404
+    assert client.post("/edit/999", data={"content": "x"}).status_code == 404
+    assert client.post("/edit/999", data={"content": "  "}).status_code == 404
+    assert client.post("/edit/999", data={"content": "x" * 201}).status_code == 404
+
+
+def test_edit_validation(client):
+    client.post("/add", data={"content": "original"})
+    with app.app_context():
+        task_id = db.session.execute(db.select(Task.id)).scalar_one()
+
+    assert client.post(f"/edit/{task_id}", data={"content": "  "}).status_code == 302
+    assert client.post(f"/edit/{task_id}", data={"content": "x" * 201}).status_code == 400
+    with app.app_context():
+        assert db.session.get(Task, task_id).content == "original"
+
+
+def test_index_page_is_clamped(client):
+    client.post("/api/tasks/bulk", json=[{"content": f"task {i}"} for i in range(60)])
+    with app.app_context():
+        task_id = db.session.execute(db.select(Task.id).limit(1)).scalar_one()
+    client.get(f"/complete/{task_id}")
+
+    response = client.get("/?page=999999999999999999999999999999")
+    assert response.status_code == 302
+    assert response.headers["Location"].endswith("/?page=2")
+    assert b"2 / 2" in client.get(response.headers["Location"]).data
+
+    first_page = client.get("/?page=1").data
+    assert b"No completed tasks on this page" in first_page
+
+
+def test_out_of_range_pages_are_not_cached(client):
+    client.post("/add", data={"content": "only task"})
+    for page in range(2, 12):
+        assert client.get(f"/?page={page}").status_code == 302
+    assert len(cache.cache._cache) <= 1
+
+
+@pytest.mark.parametrize(
+    "write",
+    [
+        lambda client, task_id: client.get(f"/complete/{task_id}"),
+        lambda client, task_id: client.get(f"/delete/{task_id}"),
+        lambda client, task_id: client.post(f"/edit/{task_id}", data={"content": "edited"}),
+    ],
+    ids=["complete", "delete", "edit"],
+)
+def test_writes_invalidate_cached_index(client, write):
+    client.post("/add", data={"content": "cached task"})
+    with app.app_context():
+        task_id = db.session.execute(db.select(Task.id)).scalar_one()
+    before = client.get("/").data
+    assert client.get("/").data == before
+
+    write(client, task_id)
+
+    assert client.get("/").data != before
+
+
+def test_bulk_add_inserts_and_skips_blank(client):
+    response = client.post(
+        "/api/tasks/bulk",
+        json=[{"content": " one "}, {"content": "   "}, {"content": "two"}],
+    )
+    assert response.status_code == 201
+    assert response.get_json() == {"inserted": 2}
+    with app.app_context():
+        contents = db.session.execute(db.select(Task.content)).scalars().all()
+    assert sorted(contents) == ["one", "two"]
+
+
+@pytest.mark.parametrize("payload", [[], [{"content": ""}, {"content": "  "}]])
+def test_bulk_add_with_nothing_to_insert(client, payload):
+    response = client.post("/api/tasks/bulk", json=payload)
+    assert response.status_code == 200
+    assert response.get_json() == {"inserted": 0}
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        {"content": "not a list"},
+        "text",
+        [{"content": 1}],
+        [{"title": "no content"}],
+        ["not an object"],
+        [{"content": "ok"}, {"content": "x" * 201}],
+    ],
+)
+def test_bulk_add_rejects_bad_payloads(client, payload):
+    assert client.post("/api/tasks/bulk", json=payload).status_code == 400
+    with app.app_context():
+        assert db.session.execute(db.select(Task.id)).first() is None
+
+
+def test_bulk_add_rejects_non_json_body(client):
+    response = client.post("/api/tasks/bulk", data="content=x")
+    assert response.status_code == 400